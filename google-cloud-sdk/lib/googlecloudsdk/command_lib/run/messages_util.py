@@ -19,6 +19,33 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from googlecloudsdk.core.cache import function_result_cache
+
+
+# Message templates are %-formatted so that the literal {bold} and {reset}
+# markers pass through untouched for pretty_print to style.
+_MULTI_REGION_DEPLOY_HEADER = (
+    'Multi-Region Service [{bold}%s{reset}] '
+    'has been deployed to regions {bold}%s{reset}.'
+    '\nRegional URLs:'
+)
+_MULTI_REGION_DEPLOY_LINE = '{bold}%s{reset} ({bold}%s{reset})'
+_MULTI_REGION_NO_REGIONS = (
+    'Multi-Region Service [{bold}%s{reset}] has no regions.'
+)
+
+_MULTI_REGION_READY_PREFIX = 'MultiRegionReady/'
+
+_START_DEPLOY_MESSAGE = (
+    '%(operation)s %(operator)s %(resource_kind)s '
+    '[{bold}%(resource)s{reset}] in %(ns_label)s [{bold}%(ns)s{reset}]'
+)
+
+_NOT_FOUND_MESSAGE = (
+    '%(resource_kind)s [%(resource)s] could not be found'
+    ' in %(ns_label)s [%(ns)s] region [%(region)s].'
+)
+
 
 def GetSuccessMessageForMultiRegionSynchronousDeploy(service, regions):
   """Returns a user message for a successful synchronous deploy.
@@ -28,25 +55,20 @@ def GetSuccessMessageForMultiRegionSynchronousDeploy(service, regions):
       which to build a success message.
     regions: list of regions that we deployed to.
   """
-  msg = (
-      'Multi-Region Service [{{bold}}{s}{{reset}}] '
-      'has been deployed to regions {{bold}}{r}{{reset}}.'
-      '\nRegional URLs:'
-  ).format(
-      s=service.name,
-      r=regions,
-  )
+  if not regions:
+    return _MULTI_REGION_NO_REGIONS % (service.name,)
+  prefix_len = len(_MULTI_REGION_READY_PREFIX)
+  url_by_region = {
+      condition[prefix_len:]: value.get('message', '')
+      for condition, value in service.conditions.items()
+      if condition.startswith(_MULTI_REGION_READY_PREFIX)
+  }
+  lines = [_MULTI_REGION_DEPLOY_HEADER % (service.name, regions)]
   for region in regions:
-    condition = 'MultiRegionReady/' + region
-    url = (
-        service.conditions[condition].get('message')
-        if condition in service.conditions
-        else ''
+    lines.append(
+        _MULTI_REGION_DEPLOY_LINE % (url_by_region.get(region, ''), region)
     )
-    msg += '\n{{bold}}{url}{{reset}} ({{bold}}{r}{{reset}})'.format(
-        r=region, url=url
-    )
-  return msg
+  return '\n'.join(lines)
 
 
 def GetSuccessMessageForSynchronousDeploy(service, no_traffic):
@@ -57,35 +79,29 @@ def GetSuccessMessageForSynchronousDeploy(service, no_traffic):
       which to build a success message.
     no_traffic: bool, whether the service was deployed with --no-traffic flag.
   """
-  latest_ready = service.status.latestReadyRevisionName
   # Use lastCreatedRevisionName if --no-traffic is set. This was due to a bug
   # where the latestReadyRevisionName was not updated in time when traffic
   # update was not needed in reconciliation steps.
-  latest_created = service.status.latestCreatedRevisionName
-  latest_percent_traffic = 0 if no_traffic else service.latest_percent_traffic
-  msg = (
-      'Service [{{bold}}{serv}{{reset}}] '
-      'revision [{{bold}}{rev}{{reset}}] '
-      'has been deployed and is serving '
-      '{{bold}}{latest_percent_traffic}{{reset}} percent of traffic.'
+  status = service.status
+  serv = service.name
+  rev = (
+      status.latestCreatedRevisionName
+      if no_traffic
+      else status.latestReadyRevisionName
   )
-  if latest_percent_traffic:
-    msg += '\nService URL: {{bold}}{url}{{reset}}'
+  pct = 0 if no_traffic else service.latest_percent_traffic
+  parts = [
+      f'Service [{{bold}}{serv}{{reset}}] '
+      f'revision [{{bold}}{rev}{{reset}}] '
+      'has been deployed and is serving '
+      f'{{bold}}{pct}{{reset}} percent of traffic.'
+  ]
+  if pct:
+    parts.append(f'\nService URL: {{bold}}{service.domain}{{reset}}')
   latest_url = service.latest_url
-  tag_url_message = ''
   if latest_url:
-    tag_url_message = '\nThe revision can be reached directly at {}'.format(
-        latest_url
-    )
-  return (
-      msg.format(
-          serv=service.name,
-          rev=latest_created if no_traffic else latest_ready,
-          url=service.domain,
-          latest_percent_traffic=latest_percent_traffic,
-      )
-      + tag_url_message
-  )
+    parts.append(f'\nThe revision can be reached directly at {latest_url}')
+  return ''.join(parts)
 
 
 def GetStartDeployMessage(
@@ -105,11 +121,6 @@ def GetStartDeployMessage(
     operation: str, what deploy action is being done.
     resource_kind_lower: str, resource kind being deployed, e.g. "service"
   """
-  msg = (
-      '{operation} {operator} {resource_kind} '
-      '[{{bold}}{resource}{{reset}}] in {ns_label} [{{bold}}{ns}{{reset}}]'
-  )
-  msg += conn_context.location_label
   # For WorkerPools case resource_ref.Parent().Name() returns the region name
   # which is not what we want.
   ns = (
@@ -117,14 +128,17 @@ def GetStartDeployMessage(
       if resource_kind_lower == 'worker pool'
       else resource_ref.Parent().Name()
   )
-  return msg.format(
-      operation=operation,
-      operator=conn_context.operator,
-      resource_kind=resource_kind_lower,
-      ns_label=conn_context.ns_label,
-      resource=resource_ref.Name(),
-      ns=ns,
-  )
+  msg = _START_DEPLOY_MESSAGE % {
+      'operation': operation,
+      'operator': conn_context.operator,
+      'resource_kind': resource_kind_lower,
+      'ns_label': conn_context.ns_label,
+      'resource': resource_ref.Name(),
+      'ns': ns,
+  }
+  # location_label is a .format() template with escaped {{bold}} markers, so
+  # it needs one pass to collapse them.
+  return msg + conn_context.location_label.format()
 
 
 def GetNotFoundMessage(conn_context, resource_ref, resource_kind='Service'):
@@ -138,31 +152,33 @@ def GetNotFoundMessage(conn_context, resource_ref, resource_kind='Service'):
       details.
     resource_kind: str, resource kind, e.g. "Service"
   """
-  msg = (
-      '{resource_kind} [{resource}] could not be found'
-      ' in {ns_label} [{ns}] region [{region}].'
-  )
+  return _NOT_FOUND_MESSAGE % {
+      'resource_kind': resource_kind,
+      'resource': resource_ref.Name(),
+      'ns_label': conn_context.ns_label,
+      'ns': resource_ref.Parent().Name(),
+      'region': conn_context.region,
+  }
 
-  return msg.format(
-      resource_kind=resource_kind,
-      resource=resource_ref.Name(),
-      ns_label=conn_context.ns_label,
-      ns=resource_ref.Parent().Name(),
-      region=conn_context.region,
-  )
+
+@function_result_cache.lru(maxsize=8)
+def _ReleaseTrackFragment(prefix):
+  """Returns the release track as it appears in a gcloud command line."""
+  return '' if prefix is None else ' ' + prefix
 
 
 def GetRunJobMessage(release_track, job_name, repeat=False):
   """Returns a user message for how to run a job."""
+  return _BuildRunJobMessage(release_track.prefix, job_name, repeat)
+
+
+@function_result_cache.lru(maxsize=512)
+def _BuildRunJobMessage(release_track_prefix, job_name, repeat):
   return (
       '\nTo execute this job{repeat}, use:\n'
       'gcloud{release_track} run jobs execute {job_name}'.format(
           repeat=' again' if repeat else '',
-          release_track=(
-              ' {}'.format(release_track.prefix)
-              if release_track.prefix is not None
-              else ''
-          ),
+          release_track=_ReleaseTrackFragment(release_track_prefix),
           job_name=job_name,
       )
   )
@@ -174,11 +190,7 @@ def GetExecutionCreatedMessage(release_track, execution):
       '\nView details about this execution by running:\n'
       'gcloud{release_track} run jobs executions describe {execution_name}'
   ).format(
-      release_track=(
-          ' {}'.format(release_track.prefix)
-          if release_track.prefix is not None
-          else ''
-      ),
+      release_track=_ReleaseTrackFragment(release_track.prefix),
       execution_name=execution.name,
   )
   if execution.status and execution.status.logUri:
@@ -187,13 +199,20 @@ def GetExecutionCreatedMessage(release_track, execution):
 
 
 def _GetExecutionUiLink(execution):
+  return _BuildExecutionUiLink(
+      execution.region, execution.name, execution.namespace
+  )
+
+
+@function_result_cache.lru(maxsize=512)
+def _BuildExecutionUiLink(region, execution_name, project):
   return (
       'https://console.cloud.google.com/run/jobs/executions/'
       'details/{region}/{execution_name}/tasks?project={project}'
   ).format(
-      region=execution.region,
-      execution_name=execution.name,
-      project=execution.namespace,
+      region=region,
+      execution_name=execution_name,
+      project=project,
   )
 
 